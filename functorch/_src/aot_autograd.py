@@ -273,9 +273,9 @@ def run_functionalized_fw_and_collect_metadata(f):
         finally:
             torch._disable_functionalization()
 
-        flat_args, _ = pytree.tree_flatten(args)
-        flat_f_args, _ = pytree.tree_flatten(f_args)
-        flat_outs, _ = pytree.tree_flatten(outs)
+        flat_args = pytree.tree_leaves(args)
+        flat_f_args = pytree.tree_leaves(f_args)
+        flat_outs = pytree.tree_leaves(outs)
 
         # Inspect the state of the input tensor functional wrapper to detect input mutation info
         inputs_with_mutated_data = []
@@ -408,7 +408,6 @@ def run_functionalized_fw_and_collect_metadata(f):
             # We'll need to ensure that we generate the view off of the right base.
             inp_storage_refs = {StorageWeakRef(inpt.storage()): idx for idx, inpt in enumerate(flat_f_args)}
             inp_tensor_ids = {id(inpt) for inpt in flat_f_args if isinstance(inpt, torch.Tensor)}
-            inp_storage_refs_set = set(inp_storage_refs)
 
             non_aliased_input_outs = []
             # For a given output tensor that alias an input, tells us:
@@ -429,8 +428,11 @@ def run_functionalized_fw_and_collect_metadata(f):
                 # Note: When detecting input/output aliasing, we NEED to do it using the outer FunctionalTensorWrapper objects.
                 # In the case where we mutate an input *and* return a view of it, the outer wrappers will still alias,
                 # but the inner tensors no longer alias.
-                if isinstance(o, torch.Tensor) and StorageWeakRef(o.storage()) in inp_storage_refs:
-                    aliased_inp_idx = inp_storage_refs[StorageWeakRef(o.storage())]
+                if isinstance(o, torch.Tensor):
+                    aliased_inp_idx = inp_storage_refs.get(StorageWeakRef(o.storage()))
+                else:
+                    aliased_inp_idx = None
+                if aliased_inp_idx is not None:
                     is_exact_input = id(o) in inp_tensor_ids
                     aliases_intermediate_and_not_input = False
                     aliased_out_idx[o] = (aliased_inp_idx, aliases_intermediate_and_not_input, is_exact_input)
@@ -1373,7 +1375,7 @@ def aot_dispatch_autograd(flat_fn, flat_args: List[Tensor], aot_config: AOTConfi
 
     if config.use_functionalize:
         with enable_python_dispatcher():
-            flattened_joints, _ = pytree.tree_flatten(joint_inputs)
+            flattened_joints = pytree.tree_leaves(joint_inputs)
             fx_g = make_fx(
                 joint_forward_backward, aot_config.decompositions
             )(*joint_inputs)
@@ -1902,13 +1904,13 @@ def aot_function(
     @wraps(fn)
     def returned_function(*args, **kwargs):
         nonlocal cached_res
-        # Now flatten the tensor args
-        flat_args, _ = pytree.tree_flatten((args, kwargs))
+        # Now flatten the tensor args.  The spec is only needed on the first
+        # call (to unflatten while tracing), but it comes for free with the
+        # flatten we need anyway.
+        flat_args, tensor_args_spec = pytree.tree_flatten((args, kwargs))
 
         # Compile the function and save it in the cache
         if cached_res is None:
-            # Save the args_spec for flat_tensor_args to unflatten while tracing
-            _, tensor_args_spec = pytree.tree_flatten((args, kwargs))
             out_spec = PytreeThunk()
 
             def flat_fn(*flat_args):
@@ -8,7 +8,7 @@ from typing import Callable, Union, Tuple, List, Any, Optional
 import torch
 from functools import partial, wraps
 import contextlib
-from torch.utils._pytree import tree_flatten, tree_unflatten, tree_map
+from torch.utils._pytree import tree_flatten, tree_unflatten, tree_map, tree_leaves
 from .pytree_hacks import tree_map_, treespec_pprint
 import torch.autograd.forward_ad as fwAD
 
@@ -47,14 +47,18 @@ def enable_inplace_requires_grad(enabled=True):
         set_inplace_requires_grad_allowed(prev_state)
 
 
+def _create_differentiable_leaf(x):
+    if isinstance(x, torch.Tensor):
+        return x.requires_grad_()
+    raise ValueError(f'Thing passed to transform API must be Tensor, '
+                     f'got {type(x)}')
+
+
 def _create_differentiable(inps, level=None):
-    def create_differentiable(x):
-        if isinstance(x, torch.Tensor):
-            with enable_inplace_requires_grad():
-                return x.requires_grad_()
-        raise ValueError(f'Thing passed to transform API must be Tensor, '
-                         f'got {type(x)}')
-    return tree_map(create_differentiable, inps)
+    # Enter the context once around the whole tree_map instead of constructing
+    # a fresh context manager per tensor leaf; this runs on every grad/vjp call.
+    with enable_inplace_requires_grad():
+        return tree_map(_create_differentiable_leaf, inps)
 
 
 def _undo_create_differentiable(inps, level=None):
@@ -847,12 +851,14 @@ def _jvp_with_argnums(func: Callable, primals: Any, tangents: Any, argnums: Opti
                 result_duals, spec = tree_flatten(result_duals)
                 assert_non_empty_tensor_output(result_duals, jvp_str)
 
-                primals_out, tangents_out = \
-                    zip(*[safe_unpack_dual(dual, strict) for dual in result_duals])
-                primals_out = tree_map(
-                    partial(_undo_create_differentiable, level=level), primals_out)
-                tangents_out = tree_map(
-                    partial(_undo_create_differentiable, level=level), tangents_out)
+                # Build the primal and tangent lists in parallel rather than
+                # materializing a list of pairs and transposing it with zip(*).
+                primals_out = []
+                tangents_out = []
+                for dual in result_duals:
+                    primal, tangent = safe_unpack_dual(dual, strict)
+                    primals_out.append(_undo_create_differentiable(primal, level))
+                    tangents_out.append(_undo_create_differentiable(tangent, level))
 
                 primals_out_unflatten = tree_unflatten(primals_out, spec)
                 tangents_out_unflatten = tree_unflatten(tangents_out, spec)
@@ -1449,25 +1455,23 @@ def functionalize(func: Callable, *, remove: str = 'mutations') -> Callable:
             func_args = _wrap_all_tensors_to_functional(args, func_level)
             func_kwargs = _wrap_all_tensors_to_functional(kwargs, func_level)
 
-            flattened_unwrapped_args, _ = tree_flatten(args)
-            flattened_wrapped_args, _ = tree_flatten(func_args)
-            flattened_unwrapped_kwargs, _ = tree_flatten(kwargs)
-            flattened_wrapped_kwargs, _ = tree_flatten(func_kwargs)
+            # args/kwargs and their wrapped versions share a structure (wrapping
+            # is a tree_map), so flatten them jointly instead of one tree walk
+            # per collection.
+            flattened_unwrapped_inputs = tree_leaves((args, kwargs))
+            flattened_wrapped_inputs = tree_leaves((func_args, func_kwargs))
 
             func_outputs = func(*func_args, **func_kwargs)
             outputs = _unwrap_all_tensors_from_functional(func_outputs, reapply_views=reapply_views)
             flat_outputs, func_out_spec = tree_flatten(outputs)
 
-            for a in flattened_wrapped_args + flattened_wrapped_kwargs:
+            for a in flattened_wrapped_inputs:
                 if isinstance(a, torch.Tensor):
                     # Call sync_() on the inputs, to ensure that any pending mutations have been applied.
                     torch._sync(a)
 
             # And if any mutations were applied to the inputs, we need to propagate them back to the user.
-            for unwrapped, wrapped in zip(flattened_unwrapped_args, flattened_wrapped_args):
-                if isinstance(unwrapped, torch.Tensor) and isinstance(wrapped, torch.Tensor):
-                    _propagate_functional_input_mutation(unwrapped, wrapped)
-            for unwrapped, wrapped in zip(flattened_unwrapped_kwargs, flattened_wrapped_kwargs):
+            for unwrapped, wrapped in zip(flattened_unwrapped_inputs, flattened_wrapped_inputs):
                 if isinstance(unwrapped, torch.Tensor) and isinstance(wrapped, torch.Tensor):
                     _propagate_functional_input_mutation(unwrapped, wrapped)
 
@@ -8,7 +8,7 @@ import torch
 import functools
 from torch import Tensor
 from typing import Any, Callable, Optional, Tuple, Union, List
-from torch.utils._pytree import tree_flatten, tree_unflatten, _broadcast_to_and_flatten, TreeSpec
+from torch.utils._pytree import tree_flatten, tree_unflatten, _broadcast_to_and_flatten, TreeSpec, LeafSpec
 from .pytree_hacks import tree_map_
 from functools import partial
 
@@ -124,15 +124,24 @@ def _create_batched_inputs(
     batched_inputs = [arg if in_dim is None else
                       _add_batch_dim(arg, in_dim, vmap_level)
                       for in_dim, arg in zip(flat_in_dims, flat_args)]
+    # Common case: `args` was a flat tuple of leaves (e.g. vmap(f)(x, y)), so
+    # reassembling it is just a tuple() call; skip the generic unflatten walk.
+    if args_spec.type is tuple and all(
+            isinstance(spec, LeafSpec) for spec in args_spec.children_specs):
+        return tuple(batched_inputs)
     return tree_unflatten(batched_inputs, args_spec)
 
 # Undos the batching (and any batch dimensions) associated with the `vmap_level`.
 
 
-def _unwrap_batched(
+def _unwrap_batched_flat(
         batched_outputs: Union[Tensor, Tuple[Tensor, ...]],
         out_dims: out_dims_t,
-        vmap_level: int, batch_size: int, func: Callable) -> Tuple:
+        vmap_level: int, batch_size: int, func: Callable) -> Tuple[List[Tensor], TreeSpec]:
+    # Flat version of _unwrap_batched: returns the unbatched leaves and the
+    # output spec without reassembling the output pytree. chunk_vmap uses this
+    # directly so that it doesn't unflatten each chunk only to re-flatten it
+    # when concatenating the chunks.
     flat_batched_outputs, output_spec = tree_flatten(batched_outputs)
 
     for out in flat_batched_outputs:
@@ -167,6 +176,20 @@ def _unwrap_batched(
         _remove_batch_dim(batched_output, vmap_level, batch_size, out_dim)
         for batched_output, out_dim in zip(flat_batched_outputs, flat_out_dims)
     ]
+    return flat_outputs, output_spec
+
+
+def _unwrap_batched(
+        batched_outputs: Union[Tensor, Tuple[Tensor, ...]],
+        out_dims: out_dims_t,
+        vmap_level: int, batch_size: int, func: Callable) -> Tuple:
+    # Fast path for the common case of a single Tensor output with an integer
+    # out_dim; the general path below would flatten and unflatten a pytree
+    # just to reach the same _remove_batch_dim call.
+    if isinstance(batched_outputs, Tensor) and isinstance(out_dims, int):
+        return _remove_batch_dim(batched_outputs, vmap_level, batch_size, out_dims)
+    flat_outputs, output_spec = _unwrap_batched_flat(
+        batched_outputs, out_dims, vmap_level, batch_size, func)
     return tree_unflatten(flat_outputs, output_spec)
 
 
@@ -354,10 +377,12 @@ def vmap(
         sequences out of the box.
     """
     _check_randomness_arg(randomness)
+    # out_dims is fixed for the lifetime of the returned function, so validate
+    # it once here rather than walking its pytree on every call.
+    _check_out_dims_is_int_or_int_pytree(out_dims, func)
 
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
-        _check_out_dims_is_int_or_int_pytree(out_dims, func)
         batch_size, flat_in_dims, flat_args, args_spec = _process_batched_inputs(in_dims, args, func)
         return _flat_vmap(
             func, batch_size, flat_in_dims, flat_args, args_spec, out_dims, randomness, **kwargs
@@ -406,6 +431,7 @@ def chunk_vmap(
         specified by :attr:`out_dims`.
     """
     _check_randomness_arg(randomness)
+    _check_out_dims_is_int_or_int_pytree(out_dims, func)
 
     if chunks == 1:
         return vmap(func, in_dims=in_dims, out_dims=out_dims, randomness=randomness)
@@ -420,44 +446,31 @@ def chunk_vmap(
         chunks_flat_args = zip(*flat_args_chunks)
         return chunks_flat_args
 
-    def _flatten_chunks_output(chunks_output_):
-        # chunks_output is a list of chunked outputs
-        # flatten chunked outputs:
-        flat_chunks_output = []
-        arg_spec_list = []
-        for output in chunks_output_:
-            flat_output, arg_specs = tree_flatten(output)
-            flat_chunks_output.append(flat_output)
-            arg_spec_list.append(arg_specs)
-
-        arg_spec = arg_spec_list[0]  # all specs should be the same
-        # transpose chunk dim and flatten structure
-        # flat_output_chunks is flat list of chunks
-        flat_output_chunks = list(zip(*flat_chunks_output))
-        return flat_output_chunks, arg_spec
-
     @functools.wraps(func)
     def wrapped_with_chunks(*args, **kwargs):
-        _check_out_dims_is_int_or_int_pytree(out_dims, func)
         _, flat_in_dims, flat_args, args_spec = _process_batched_inputs(in_dims, args, func)
         # Chunk flat arguments
         chunks_flat_args = _get_chunk_flat_args(flat_args, flat_in_dims, chunks)
 
-        # Apply vmap on chunks
-        chunks_output = []
+        # Apply vmap on chunks, keeping each chunk's output flat (all specs
+        # are the same, so there is no need to unflatten per chunk only to
+        # re-flatten below)
+        flat_chunks_output = []
+        arg_spec = None
         rs = torch.get_rng_state() if randomness == "same" else None
         for flat_args in chunks_flat_args:
             batch_size = _validate_and_get_batch_size(flat_in_dims, flat_args)
             if rs is not None:
                 torch.set_rng_state(rs)
-            chunks_output.append(
-                _flat_vmap(
-                    func, batch_size, flat_in_dims, flat_args, args_spec, out_dims, randomness, **kwargs
-                )
+            flat_output, arg_spec = _flat_vmap_flat_out(
+                func, batch_size, flat_in_dims, flat_args, args_spec, out_dims, randomness, **kwargs
             )
-        flat_output_chunks, arg_spec = _flatten_chunks_output(chunks_output)
+            flat_chunks_output.append(flat_output)
+        # transpose chunk dim and flatten structure
+        # flat_output_chunks is flat list of chunks
+        flat_output_chunks = list(zip(*flat_chunks_output))
         # Removing temporary variables helps to reduce memory usage on device like CUDA
-        del chunks_output
+        del flat_chunks_output
 
         # concat chunks on out_dim
         flat_out_dims = _broadcast_to_and_flatten(out_dims, arg_spec)
@@ -490,3 +503,14 @@ def _flat_vmap(func, batch_size, flat_in_dims, flat_args, args_spec, out_dims, r
         return _unwrap_batched(batched_outputs, out_dims, vmap_level, batch_size, func)
     finally:
         _vmap_decrement_nesting()
+
+
+@doesnt_support_saved_tensors_hooks
+def _flat_vmap_flat_out(func, batch_size, flat_in_dims, flat_args, args_spec, out_dims, randomness, **kwargs):
+    vmap_level = _vmap_increment_nesting(batch_size, randomness)
+    try:
+        batched_inputs = _create_batched_inputs(flat_in_dims, flat_args, vmap_level, args_spec)
+        batched_outputs = func(*batched_inputs, **kwargs)
+        return _unwrap_batched_flat(batched_outputs, out_dims, vmap_level, batch_size, func)
+    finally:
+        _vmap_decrement_nesting()
@@ -4,7 +4,7 @@ import torch
 from torch.testing._internal.common_utils import TestCase, run_tests
 from torch.utils._pytree import tree_flatten, tree_map, tree_unflatten, TreeSpec, LeafSpec
 from torch.utils._pytree import _broadcast_to_and_flatten, tree_map_only, tree_all
-from torch.utils._pytree import tree_any, tree_all_only, tree_any_only
+from torch.utils._pytree import tree_any, tree_all_only, tree_any_only, tree_leaves
 from collections import namedtuple, OrderedDict
 from torch.testing._internal.common_utils import parametrize, subtest, instantiate_parametrized_tests
 
@@ -187,6 +187,17 @@ class TestPytree(TestCase):
         self.assertEqual(tree_map_only(int, lambda x: x + 2, [0, "a"]), [2, "a"])
 
 
+    def test_tree_leaves(self):
+        def run_test(pytree):
+            values, _ = tree_flatten(pytree)
+            self.assertEqual(tree_leaves(pytree), values)
+
+        run_test(1)
+        run_test([])
+        run_test([1., 2])
+        run_test({'a': 1, 'b': (2, [3, 4])})
+        run_test((torch.randn(3, 3), 1, None))
+
     def test_tree_all_any(self):
         self.assertTrue(tree_all(lambda x: x % 2, [1, 3]))
         self.assertFalse(tree_all(lambda x: x % 2, [0, 1]))
@@ -122,13 +122,20 @@ class GradInterpreter(FuncTorchInterpreter):
         return self._cptr.prevGradMode()
 
 
+# Table from TransformType to the interpreter wrapper class; looked up on
+# every dispatch, so keep it a dict rather than an if-chain over keys.
+_transform_to_interpreter = {
+    TransformType.Grad: GradInterpreter,
+    TransformType.Vmap: VmapInterpreter,
+}
+
+
 def coerce_cinterpreter(cinterpreter: CInterpreter) -> FuncTorchInterpreter:
     key = cinterpreter.key()
-    if key == TransformType.Grad:
-        return GradInterpreter(cinterpreter)
-    if key == TransformType.Vmap:
-        return VmapInterpreter(cinterpreter)
-    raise RuntimeError(f"NYI: PyDispatcher has not implemented support for {key}")
+    interpreter_cls = _transform_to_interpreter.get(key)
+    if interpreter_cls is None:
+        raise RuntimeError(f"NYI: PyDispatcher has not implemented support for {key}")
+    return interpreter_cls(cinterpreter)
 
 
 def retrieve_current_functorch_interpreter():
@@ -85,8 +85,11 @@ _register_pytree_node(OrderedDict, _odict_flatten, _odict_unflatten)
 
 
 # h/t https://stackoverflow.com/questions/2166818/how-to-check-if-an-object-is-an-instance-of-a-namedtuple
-def _is_namedtuple_instance(pytree: Any) -> bool:
-    typ = type(pytree)
+# The answer is cached per-class: classes are long-lived, and this check runs
+# once per node on every tree traversal, so recomputing it dominates the cost
+# of flattening small pytrees.
+@functools.lru_cache(maxsize=None)
+def _is_namedtuple_class(typ: Any) -> bool:
     bases = typ.__bases__
     if len(bases) != 1 or bases[0] != tuple:
         return False
@@ -95,14 +98,18 @@ def _is_namedtuple_instance(pytree: Any) -> bool:
         return False
     return all(type(entry) == str for entry in fields)
 
+def _is_namedtuple_instance(pytree: Any) -> bool:
+    return _is_namedtuple_class(type(pytree))
+
 def _get_node_type(pytree: Any) -> Any:
-    if _is_namedtuple_instance(pytree):
+    typ = type(pytree)
+    if _is_namedtuple_class(typ):
         return namedtuple
-    return type(pytree)
+    return typ
 
 # A leaf is defined as anything that is not a Node.
 def _is_leaf(pytree: PyTree) -> bool:
-    return _get_node_type(pytree) not in SUPPORTED_NODES.keys()
+    return _get_node_type(pytree) not in SUPPORTED_NODES
 
 
 # A TreeSpec represents the structure of a pytree. It holds:
@@ -139,26 +146,55 @@ class LeafSpec(TreeSpec):
     def __repr__(self, indent: int = 0) -> str:
         return '*'
 
+def _tree_flatten(pytree: PyTree, leaves: List[Any]) -> TreeSpec:
+    # Flattens into the `leaves` accumulator; a single list shared across the
+    # recursion avoids allocating and concatenating a list per node.
+    node_type = _get_node_type(pytree)
+    node_def = SUPPORTED_NODES.get(node_type)
+    if node_def is None:
+        # Not a registered Node type, i.e. a leaf.  Checking via .get saves a
+        # second SUPPORTED_NODES lookup compared to _is_leaf + subscript.
+        leaves.append(pytree)
+        return LeafSpec()
+
+    child_pytrees, context = node_def.flatten_fn(pytree)
+
+    # Recursively flatten the children
+    children_specs = [_tree_flatten(child, leaves) for child in child_pytrees]
+
+    return TreeSpec(node_type, context, children_specs)
+
+
 def tree_flatten(pytree: PyTree) -> Tuple[List[Any], TreeSpec]:
     """Flattens a pytree into a list of values and a TreeSpec that can be used
     to reconstruct the pytree.
     """
-    if _is_leaf(pytree):
-        return [pytree], LeafSpec()
+    leaves : List[Any] = []
+    spec = _tree_flatten(pytree, leaves)
+    return leaves, spec
+
 
+def _tree_leaves(pytree: PyTree, leaves: List[Any]) -> None:
     node_type = _get_node_type(pytree)
-    flatten_fn = SUPPORTED_NODES[node_type].flatten_fn
-    child_pytrees, context = flatten_fn(pytree)
+    node_def = SUPPORTED_NODES.get(node_type)
+    if node_def is None:
+        leaves.append(pytree)
+        return
 
-    # Recursively flatten the children
-    result : List[Any] = []
-    children_specs : List['TreeSpec'] = []
+    child_pytrees, _ = node_def.flatten_fn(pytree)
     for child in child_pytrees:
-        flat, child_spec = tree_flatten(child)
-        result += flat
-        children_specs.append(child_spec)
+        _tree_leaves(child, leaves)
+
 
-    return result, TreeSpec(node_type, context, children_specs)
+def tree_leaves(pytree: PyTree) -> List[Any]:
+    """Gets a list of leaves of a pytree.
+
+    This is cheaper than `tree_flatten` when the TreeSpec is not needed, since
+    it skips constructing the spec entirely.
+    """
+    leaves : List[Any] = []
+    _tree_leaves(pytree, leaves)
+    return leaves
 
 
 def tree_unflatten(values: List[Any], spec: TreeSpec) -> PyTree:
@@ -256,14 +292,18 @@ def tree_map_only(ty: Type2[T, S], fn: Fn2[T, S, Any], pytree: PyTree) -> PyTree
     ...
 
 def tree_map_only(ty: TypeAny, fn: FnAny[Any], pytree: PyTree) -> PyTree:
-    return tree_map(map_only(ty)(fn), pytree)
+    # Inlined map_only(ty)(fn): a bare closure avoids the decorator and
+    # functools.wraps machinery on this fairly hot path.
+    flat_args, spec = tree_flatten(pytree)
+    return tree_unflatten(
+        [fn(i) if isinstance(i, ty) else i for i in flat_args], spec)
 
 def tree_all(pred: Callable[[Any], bool], pytree: PyTree) -> bool:
-    flat_args, _ = tree_flatten(pytree)
+    flat_args = tree_leaves(pytree)
     return all(map(pred, flat_args))
 
 def tree_any(pred: Callable[[Any], bool], pytree: PyTree) -> bool:
-    flat_args, _ = tree_flatten(pytree)
+    flat_args = tree_leaves(pytree)
     return any(map(pred, flat_args))
 
 @overload
@@ -275,7 +315,7 @@ def tree_all_only(ty: Type2[T, S], pred: Fn2[T, S, bool], pytree: PyTree) -> boo
     ...
 
 def tree_all_only(ty: TypeAny, pred: FnAny[bool], pytree: PyTree) -> bool:
-    flat_args, _ = tree_flatten(pytree)
+    flat_args = tree_leaves(pytree)
     return all(pred(x) for x in flat_args if isinstance(x, ty))
 
 @overload
@@ -287,7 +327,7 @@ def tree_any_only(ty: Type2[T, S], pred: Fn2[T, S, bool], pytree: PyTree) -> boo
     ...
 
 def tree_any_only(ty: TypeAny, pred: FnAny[bool], pytree: PyTree) -> bool:
-    flat_args, _ = tree_flatten(pytree)
+    flat_args = tree_leaves(pytree)
     return any(pred(x) for x in flat_args if isinstance(x, ty))
 
 # Broadcasts a pytree to the provided TreeSpec and returns the flattened
@@ -301,16 +341,16 @@ def tree_any_only(ty: TypeAny, pred: FnAny[bool], pytree: PyTree) -> bool:
 def _broadcast_to_and_flatten(pytree: PyTree, spec: TreeSpec) -> Optional[List[Any]]:
     assert isinstance(spec, TreeSpec)
 
-    if _is_leaf(pytree):
+    node_type = _get_node_type(pytree)
+    node_def = SUPPORTED_NODES.get(node_type)
+    if node_def is None:
         return [pytree] * spec.num_leaves
     if isinstance(spec, LeafSpec):
         return None
-    node_type = _get_node_type(pytree)
     if node_type != spec.type:
         return None
 
-    flatten_fn = SUPPORTED_NODES[node_type].flatten_fn
-    child_pytrees, ctx = flatten_fn(pytree)
+    child_pytrees, ctx = node_def.flatten_fn(pytree)
 
     # Check if the Node is different from the spec
     if len(child_pytrees) != len(spec.children_specs) or ctx != spec.context:
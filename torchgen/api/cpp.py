@@ -224,6 +224,16 @@ def argument_type(a: Argument, *, binds: ArgName, symint: bool = False) -> Named
 # This is mostly because of the mismatch between return types and return names.
 # e.g. a function with a return type of 'void' has 0 return names,
 # and a function with a return type of 'std::tuple' has >1 return name.
+#
+# CTypes are frozen, so the common Tensor/Scalar/void return types can be
+# constructed once and shared across every schema we translate.
+_mut_ref_tensor_ret = MutRefCType(BaseCType(tensorT))
+_const_ref_tensor_ret = ConstRefCType(BaseCType(tensorT))
+_tensor_ret = BaseCType(tensorT)
+_scalar_ret = BaseCType(scalarT)
+_void_ret = BaseCType(voidT)
+
+
 def returntype_type(t: Type, *, mutable: bool, symint: bool = False) -> CType:
     # placeholder is ignored
     r = valuetype_type(t, binds="__placeholder__", symint=symint)
@@ -234,17 +244,17 @@ def returntype_type(t: Type, *, mutable: bool, symint: bool = False) -> CType:
         if t.name == BaseTy.Tensor:
             if mutable:
                 if local.use_const_ref_for_mutable_tensors():
-                    return ConstRefCType(BaseCType(tensorT))
+                    return _const_ref_tensor_ret
                 else:
-                    return MutRefCType(BaseCType(tensorT))
+                    return _mut_ref_tensor_ret
             else:
                 # Note [Tensor Copy Returns]
                 # Currently, we use "Argument.is_write" to determine
                 # whether or not Tensor return types should be copies or references.
                 # If that ever changes, take a look at other locations of this note!
-                return BaseCType(tensorT)
+                return _tensor_ret
         elif t.name == BaseTy.Scalar:
-            return BaseCType(scalarT)
+            return _scalar_ret
     elif isinstance(t, ListType):
         assert (
             not mutable
@@ -264,7 +274,7 @@ def return_type(r: Return, *, symint: bool = False) -> CType:
 # Translation of a full (possibly multi) return from JIT to its C++ type
 def returns_type(rs: Sequence[Return], *, symint: bool = False) -> CType:
     if len(rs) == 0:
-        return BaseCType(voidT)
+        return _void_ret
     elif len(rs) == 1:
         return return_type(rs[0], symint=symint)
     else:
@@ -1,3 +1,5 @@
+import functools
+
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar, Union
@@ -627,9 +629,13 @@ class DispatcherSignature:
         return f"{self.returns_type().cpp_type()} ({dispatcher_args_types_str})"
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def from_schema(
         func: FunctionSchema, *, prefix: str = "", symint: bool = True
     ) -> "DispatcherSignature":
+        # Memoized: codegen asks for the signature of the same (immutable)
+        # FunctionSchema many times across its passes, and both the schema and
+        # the resulting signature are frozen, so sharing instances is safe.
         return DispatcherSignature(func, prefix, symint)
 
 
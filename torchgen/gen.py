@@ -5,6 +5,8 @@ import os
 import pathlib
 from collections import defaultdict, namedtuple, OrderedDict
 from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, TypeVar, Union
 
 import yaml
@@ -1529,6 +1531,12 @@ def get_native_function_definitions(
             reg_gen(f),
         )
 
+    # Only depends on the backend index, so compute it once instead of once
+    # per kernel namespace inside the template substitution below.
+    dispatch_helpers = (
+        dest.gen_registration_helpers(backend_idx) if gen_dispatch_helpers else []
+    )
+
     for kernel_namespace in ns_definitions:
         if len(ns_definitions[kernel_namespace]) == 0:
             continue
@@ -1547,9 +1555,7 @@ TORCH_LIBRARY_IMPL({namespace}, {dispatch_key}, m) {{
                 lambda: {
                     "ns_prologue": ns_helper.prologue,
                     "ns_epilogue": ns_helper.epilogue,
-                    "dispatch_helpers": dest.gen_registration_helpers(backend_idx)
-                    if gen_dispatch_helpers
-                    else [],
+                    "dispatch_helpers": dispatch_helpers,
                     "dispatch_anonymous_definitions": anonymous_definitions[
                         kernel_namespace
                     ],
@@ -1618,41 +1624,52 @@ def get_namespaced_declaration(
 
 
 # Return native function schema registration code for aten and other namespaces.
+def _gen_custom_namespace_schema_registration(
+    namespace: str, schema_registrations_body: List[str]
+) -> str:
+    tab = "\t"
+    # if the namespace is predefined, we should use define a library fragment
+    # instead of a new library
+    torch_library_macro = (
+        "TORCH_LIBRARY_FRAGMENT" if namespace in FRAGMENT_NAMESPACES else "TORCH_LIBRARY"
+    )
+    return f"""
+{torch_library_macro}({namespace}, m) {{
+  {tab.join(schema_registrations_body)}
+}};"""
+
+
 def get_native_function_schema_registrations(
     *,
     native_functions: Sequence[NativeFunction],
     schema_selector: SelectiveBuilder,
 ) -> Tuple[List[str], str]:
     ns_native_functions: Dict[str, List[NativeFunction]] = defaultdict(list)
-    for native_function in native_functions:
-        ns_native_functions[native_function.namespace].append(native_function)
-    schema_registrations = ""
+    # native_functions arrives with namespaces contiguous (all of aten first,
+    # then each custom namespace), so grouping consecutive runs costs one dict
+    # lookup per run instead of one per function. Extending the defaultdict
+    # keeps this correct (and order-preserving) even for non-contiguous input.
+    for namespace, funcs in groupby(native_functions, key=attrgetter("namespace")):
+        ns_native_functions[namespace].extend(funcs)
+    custom_schema_registrations = []
     aten_schema_registrations = []
-    custom_namespace = None
+    # One RegisterSchema instance serves every namespace; no need to rebuild
+    # the dataclass per loop iteration.
+    register_schema = RegisterSchema(schema_selector)
     for namespace, funcs in ns_native_functions.items():
 
-        schema_registrations_body = list(
-            mapMaybe(RegisterSchema(schema_selector), funcs)
-        )
+        schema_registrations_body = list(mapMaybe(register_schema, funcs))
         # NB: we have to separate aten namespace registration from other namespaces,
         # because in the template we hardcoded an operator for ATen already.
         if namespace == "aten":
             aten_schema_registrations = schema_registrations_body
         else:
-            custom_namespace = namespace
-            tab = "\t"
-            # if the namespace is predefined, we should use define a library fragment
-            # instead of a new library
-            torch_library_macro = (
-                "TORCH_LIBRARY_FRAGMENT"
-                if namespace in FRAGMENT_NAMESPACES
-                else "TORCH_LIBRARY"
+            custom_schema_registrations.append(
+                _gen_custom_namespace_schema_registration(
+                    namespace, schema_registrations_body
+                )
             )
-            schema_registrations += f"""
-{torch_library_macro}({custom_namespace}, m) {{
-  {tab.join(schema_registrations_body)}
-}};"""
-    return (aten_schema_registrations, schema_registrations)
+    return (aten_schema_registrations, "".join(custom_schema_registrations))
 
 
 def gen_aggregated_headers(
@@ -1900,21 +1917,21 @@ def gen_per_operator_headers(
         dispatch_namespace = dispatch_key.lower()
         dispatch_names = []
 
+        # Construct the generator once per dispatch key; only the functions
+        # it is applied to vary across the inner loop.
+        namespaced_declaration_gen = dest.RegisterDispatchKey(
+            backend_indices[dispatch_key],
+            Target.NAMESPACED_DECLARATION,
+            selector,
+            rocm=rocm,
+            symint=True,
+            class_method_name=None,
+            skip_dispatcher_op_registration=False,
+        )
         for name, functions in functions_by_root_name.items():
             grouped_functions = grouped_functions_by_root_name.get(name, [])
             declarations = list(
-                concatMap(
-                    dest.RegisterDispatchKey(
-                        backend_indices[dispatch_key],
-                        Target.NAMESPACED_DECLARATION,
-                        selector,
-                        rocm=rocm,
-                        symint=True,
-                        class_method_name=None,
-                        skip_dispatcher_op_registration=False,
-                    ),
-                    grouped_functions,
-                )
+                concatMap(namespaced_declaration_gen, grouped_functions)
             )
 
             if len(declarations) == 0:
@@ -251,7 +251,7 @@ class ComputeBatchRulePlumbing:
 
 
 def gen_all_vmap_plumbing(native_functions: Sequence[NativeFunction]) -> str:
-    body = "\n".join(list(mapMaybe(ComputeBatchRulePlumbing(), native_functions)))
+    body = "\n".join(mapMaybe(ComputeBatchRulePlumbing(), native_functions))
     return f"""
 #pragma once
 #include <ATen/Operators.h>